@@ -1,8 +1,54 @@
 import sys
 import os
+import atexit
+import errno
+import re
+import json
+import mmap
+import shutil
+import stat
+import tempfile
+import threading
+import multiprocessing
 from pathlib import Path
-from datetime import datetime
+from time import monotonic, perf_counter_ns
 from typing import Any
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+import ijson
+
+
+def _dumps_escaped(obj: Any, pretty: bool = False) -> bytes:
+    # 짝 없는 서로게이트는 UTF-8 로 인코딩할 수 없으므로 \uXXXX 이스케이프로 기록
+    return json.dumps(obj, indent=2 if pretty else None).encode("ascii")
+
+
+try:
+    import orjson
+
+    def _dumps(obj: Any, pretty: bool = False) -> bytes:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        try:
+            return orjson.dumps(obj, option=option)
+        except orjson.JSONEncodeError:
+            return _dumps_escaped(obj, pretty)
+
+    def _loads(data: bytes) -> Any:
+        # orjson 은 짝 없는 서로게이트 이스케이프를 거부하므로 json 으로 재시도
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return json.loads(data)
+except ImportError:
+    def _dumps(obj: Any, pretty: bool = False) -> bytes:
+        try:
+            return json.dumps(obj, ensure_ascii=False, indent=2 if pretty else None).encode("utf-8")
+        except UnicodeEncodeError:
+            return _dumps_escaped(obj, pretty)
+
+    _loads = json.loads
 
 # 원본 NTFS_Parser 패키지 경로 추가
 NTFS_PARSER_PATH = Path(__file__).parent.parent / "NTFS_Parser"
@@ -10,11 +56,30 @@ sys.path.insert(0, str(NTFS_PARSER_PATH))
 
 from mcp.server.fastmcp import FastMCP
 
+from src.mft_parser import parse_mft_file, MFTParser
+from src.usnjrnl_parser import parse_usnjrnl as _parse_usnjrnl
+from src.logfile_parser import parse_logfile as _parse_logfile
+from src.image_handler import ImageHandler, find_ntfs_partitions, NTFSExtractor
+
 # MCP 서버 생성
 mcp = FastMCP("ntfs-parser")
 
 VERSION = "1.0.0"
 
+# 대용량 JSON 출력용 쓰기 버퍼 크기 (1 MiB)
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+def _stat_file(path: str, allow_device: bool = False) -> os.stat_result | None:
+    # 일반 파일(이미지는 블록 디바이스 허용)이 아니면 None (디렉토리 거부)
+    try:
+        st = os.stat(path)
+    except (OSError, ValueError):
+        return None
+    if stat.S_ISREG(st.st_mode) or (allow_device and stat.S_ISBLK(st.st_mode)):
+        return st
+    return None
+
 
 @mcp.tool()
 def parse_mft(
@@ -22,16 +87,15 @@ def parse_mft(
     output_path: str
 ) -> dict[str, Any]:
 
-    from src.mft_parser import parse_mft_file, MFTParser
-
-    if not Path(input_path).exists():
+    st = _stat_file(input_path)
+    if st is None:
         return {"success": False, "error": f"Input file not found: {input_path}"}
 
     try:
         parser = MFTParser(input_path)
         total = parser.get_total_entries()
 
-        start_time = datetime.now()
+        start_time = perf_counter_ns()
 
         parse_mft_file(
             input_path,
@@ -41,7 +105,7 @@ def parse_mft(
             include_path=True
         )
 
-        elapsed = (datetime.now() - start_time).total_seconds()
+        elapsed = (perf_counter_ns() - start_time) / 1e9
 
         return {
             "success": True,
@@ -59,14 +123,13 @@ def parse_usnjrnl(
     output_path: str
 ) -> dict[str, Any]:
 
-    from src.usnjrnl_parser import parse_usnjrnl as _parse_usnjrnl
-
-    if not Path(input_path).exists():
+    st = _stat_file(input_path)
+    if st is None:
         return {"success": False, "error": f"Input file not found: {input_path}"}
 
     try:
-        file_size = Path(input_path).stat().st_size
-        start_time = datetime.now()
+        file_size = st.st_size
+        start_time = perf_counter_ns()
 
         _parse_usnjrnl(
             input_path,
@@ -76,7 +139,7 @@ def parse_usnjrnl(
             include_path=False
         )
 
-        elapsed = (datetime.now() - start_time).total_seconds()
+        elapsed = (perf_counter_ns() - start_time) / 1e9
 
         return {
             "success": True,
@@ -94,17 +157,16 @@ def parse_logfile(
     output_path: str
 ) -> dict[str, Any]:
 
-    from src.logfile_parser import parse_logfile as _parse_logfile
-
-    if not Path(input_path).exists():
+    st = _stat_file(input_path)
+    if st is None:
         return {"success": False, "error": f"Input file not found: {input_path}"}
 
     try:
-        start_time = datetime.now()
+        start_time = perf_counter_ns()
 
         _parse_logfile(input_path, output_path, output_format="json")
 
-        elapsed = (datetime.now() - start_time).total_seconds()
+        elapsed = (perf_counter_ns() - start_time) / 1e9
 
         return {
             "success": True,
@@ -115,15 +177,119 @@ def parse_logfile(
         return {"success": False, "error": str(e)}
 
 
+def _extract_artifacts(extractor, dest_dir: Path, prefix: str = "") -> dict[str, str]:
+    # 파티션 하나의 아티팩트(MFT -> LogFile -> UsnJrnl)를 한 번에 추출
+    extracted = {}
+
+    mft_path = dest_dir / f"{prefix}MFT"
+    if extractor.extract_mft(str(mft_path)):
+        extracted["mft"] = str(mft_path)
+
+    logfile_path = dest_dir / f"{prefix}LogFile"
+    if extractor.extract_logfile(str(logfile_path)):
+        extracted["logfile"] = str(logfile_path)
+
+    usnjrnl_path = dest_dir / f"{prefix}UsnJrnl_J"
+    if extractor.extract_usnjrnl(str(usnjrnl_path), verbose=False):
+        extracted["usnjrnl"] = str(usnjrnl_path)
+
+    return extracted
+
+
+# 이미지별 NTFS 파티션 레이아웃 캐시: (경로, mtime_ns, 크기) -> ((offset, cluster_size), ...)
+_partition_layouts: dict[tuple, tuple] = {}
+
+
+def _layout_key(image_path: str, st: os.stat_result) -> tuple:
+    return (os.path.abspath(image_path), st.st_mtime_ns, st.st_size)
+
+
+def _partition_layout(partitions) -> tuple:
+    return tuple((part.offset, part.cluster_size) for part in partitions)
+
+
+# 열린 이미지 핸들 캐시 (E01 재오픈 비용 절감): 레이아웃 키 -> [handler, image, 참조 수, 마지막 사용 시각]
+IMAGE_CACHE_TTL = 300
+_image_cache: dict[tuple, list] = {}
+_image_cache_lock = threading.Lock()
+_image_sweep_timer: threading.Timer | None = None
+
+
+def _close_image(entry: list) -> None:
+    entry[0].__exit__(None, None, None)
+
+
+def _sweep_images() -> None:
+    # 사용 중이지 않고 TTL 이 지난 핸들을 닫고, 남은 유휴 핸들이 있으면 다음 정리를 예약
+    global _image_sweep_timer
+
+    with _image_cache_lock:
+        now = monotonic()
+        next_expiry = None
+        for key, entry in list(_image_cache.items()):
+            if entry[2]:
+                continue
+            remaining = IMAGE_CACHE_TTL - (now - entry[3])
+            if remaining <= 0:
+                del _image_cache[key]
+                _close_image(entry)
+            elif next_expiry is None or remaining < next_expiry:
+                next_expiry = remaining
+
+        if _image_sweep_timer is not None:
+            _image_sweep_timer.cancel()
+            _image_sweep_timer = None
+        if next_expiry is not None:
+            _image_sweep_timer = threading.Timer(next_expiry, _sweep_images)
+            _image_sweep_timer.daemon = True
+            _image_sweep_timer.start()
+
+
+@atexit.register
+def _close_all_images() -> None:
+    # 서버 종료 시 남은 핸들을 모두 닫음 (Windows 에서 증거 파일 잠금 해제)
+    with _image_cache_lock:
+        if _image_sweep_timer is not None:
+            _image_sweep_timer.cancel()
+        for entry in _image_cache.values():
+            _close_image(entry)
+        _image_cache.clear()
+
+
+@contextmanager
+def _cached_image(key: tuple):
+    with _image_cache_lock:
+        entry = _image_cache.get(key)
+        if entry is None:
+            handler = ImageHandler(key[0])
+            entry = _image_cache[key] = [handler, handler.__enter__(), 0, monotonic()]
+        entry[2] += 1
+
+    try:
+        yield entry[1]
+    except BaseException:
+        # 작업 중 오류가 난 핸들은 재사용하지 않도록 캐시에서 제거
+        with _image_cache_lock:
+            if _image_cache.get(key) is entry:
+                del _image_cache[key]
+        raise
+    finally:
+        with _image_cache_lock:
+            entry[2] -= 1
+            entry[3] = monotonic()
+            if entry[2] == 0 and _image_cache.get(key) is not entry:
+                _close_image(entry)
+        _sweep_images()
+
+
 @mcp.tool()
 def extract_from_image(
     input_path: str,
     output_path: str
 ) -> dict[str, Any]:
 
-    from src.image_handler import ImageHandler, find_ntfs_partitions, NTFSExtractor
-
-    if not Path(input_path).exists():
+    st = _stat_file(input_path, allow_device=True)
+    if st is None:
         return {"success": False, "error": f"Image file not found: {input_path}"}
 
     try:
@@ -131,8 +297,19 @@ def extract_from_image(
 
         results = {"success": True, "partitions": []}
 
-        with ImageHandler(input_path) as image:
+        # 이전 호출에서 NTFS 파티션이 없던 이미지는 다시 열지 않음
+        layout_key = _layout_key(input_path, st)
+        if _partition_layouts.get(layout_key) == ():
+            results["total_partitions"] = 0
+            return results
+
+        with _cached_image(layout_key) as image:
             partitions = find_ntfs_partitions(image)
+            _partition_layouts[layout_key] = _partition_layout(partitions)
+            if not partitions:
+                results["total_partitions"] = 0
+                return results
+
             partitions_to_process = list(enumerate(partitions))
 
             for i, part in partitions_to_process:
@@ -144,21 +321,7 @@ def extract_from_image(
                 }
 
                 extractor = NTFSExtractor(part)
-
-                # MFT
-                mft_path = Path(output_path) / f"partition{i}_MFT"
-                if extractor.extract_mft(str(mft_path)):
-                    part_result["extracted"]["mft"] = str(mft_path)
-
-                # LogFile
-                logfile_path = Path(output_path) / f"partition{i}_LogFile"
-                if extractor.extract_logfile(str(logfile_path)):
-                    part_result["extracted"]["logfile"] = str(logfile_path)
-
-                # UsnJrnl
-                usnjrnl_path = Path(output_path) / f"partition{i}_UsnJrnl_J"
-                if extractor.extract_usnjrnl(str(usnjrnl_path), verbose=False):
-                    part_result["extracted"]["usnjrnl"] = str(usnjrnl_path)
+                part_result["extracted"] = _extract_artifacts(extractor, Path(output_path), f"partition{i}_")
 
                 results["partitions"].append(part_result)
 
@@ -171,109 +334,288 @@ def extract_from_image(
         return {"success": False, "error": str(e)}
 
 
-@mcp.tool()
-def extract_and_analyze(input_path: str, output_path: str) -> dict[str, Any]:
-
-    import json
-    import tempfile
-    from src.image_handler import ImageHandler, find_ntfs_partitions, NTFSExtractor
-    from src.mft_parser import parse_mft_file
-    from src.usnjrnl_parser import parse_usnjrnl
-    from src.logfile_parser import parse_logfile as _parse_logfile
-
-    if not Path(input_path).exists():
-        return {"success": False, "output_path": output_path}
-
+def _splice_json(out, src_path: Path) -> None:
+    # 파서가 출력한 JSON 바이트를 역직렬화 없이 그대로 이어 붙임
+    with open(src_path, "rb") as src:
+        size = os.fstat(src.fileno()).st_size
+        if sys.platform.startswith("linux"):
+            # 커널 내부 복사 (zero-copy)
+            out.flush()
+            offset = 0
+            while offset < size:
+                sent = os.sendfile(out.fileno(), src.fileno(), offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+            out.seek(0, os.SEEK_END)
+        else:
+            shutil.copyfileobj(src, out, WRITE_BUFFER_SIZE)
+
+
+def _write_combined(path: Path, partition_info: dict, sections: list) -> None:
+    # {"partition_info": ..., "<key>": <파서 출력>, ...} 형태로 스트리밍 기록
+    with open(path, "wb", buffering=WRITE_BUFFER_SIZE) as out:
+        out.write(b'{"partition_info":')
+        out.write(_dumps(partition_info))
+
+        for key, source in sections:
+            out.write(b',"' + key.encode("utf-8") + b'":')
+            if source is None:
+                out.write(b"[]")
+            elif isinstance(source, dict):
+                out.write(_dumps(source))
+            else:
+                # 복사 중 오류 시 해당 섹션만 error 객체로 대체
+                section_start = out.tell()
+                try:
+                    _splice_json(out, source)
+                except OSError as e:
+                    out.seek(section_start)
+                    out.truncate()
+                    out.write(_dumps({"error": str(e)}))
+
+        out.write(b"}")
+
+
+def _check_json_output(json_path: Path) -> None:
+    # 파서 출력이 비어 있거나 잘린 경우 (첫/끝 바이트의 괄호 짝 불일치) 예외 발생
+    with open(json_path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        head = f.read(4096).lstrip()
+        f.seek(max(0, size - 4096))
+        tail = f.read().rstrip()
+
+    if not head:
+        raise ValueError(f"Parser produced empty output: {json_path.name}")
+    if (head[:1], tail[-1:]) not in ((b"[", b"]"), (b"{", b"}")):
+        raise ValueError(f"Parser produced truncated or malformed JSON: {json_path.name}")
+
+
+def _run_parser(parse_func, raw_path: str, json_path: Path, **kwargs) -> Any:
+    # 파싱 성공 시 JSON 출력 경로, 실패 시 error dict 반환
     try:
-        start_time = datetime.now()
-        Path(output_path).mkdir(parents=True, exist_ok=True)
-
-        results = {"partitions": []}
+        parse_func(raw_path, str(json_path), **kwargs)
+        _check_json_output(json_path)
+        return json_path
+    except OSError as e:
+        # 임시 디렉토리 공간 부족은 디스크에서 재시도하도록 전파
+        if e.errno == errno.ENOSPC:
+            raise
+        return {"error": str(e)}
+    except Exception as e:
+        return {"error": str(e)}
+    finally:
+        # 원본 아티팩트는 더 이상 필요 없으므로 즉시 삭제 (tmpfs 점유 최소화)
+        Path(raw_path).unlink(missing_ok=True)
+
+
+def _reindent_json(path: Path) -> None:
+    # 사람이 읽기 위한 들여쓰기 출력 (파일 전체를 메모리에 로드)
+    data = _loads(path.read_bytes())
+    path.write_bytes(_dumps(data, pretty=True))
+
+
+# E01 / Ex01 첫 세그먼트 파일명 (이후 세그먼트: .E02 ... .E99, .EAA ... .EZZ)
+_E01_SEGMENT_RE = re.compile(r"(.+)\.e(x?)01", re.IGNORECASE)
+
+
+def _image_size(image_path: str, st: os.stat_result, image: Any) -> int | None:
+    # 열린 이미지가 보고하는 논리 미디어 크기 우선 (E01 첫 세그먼트의 st_size 는 압축된 일부일 뿐)
+    for name in ("get_media_size", "get_size"):
+        getter = getattr(image, name, None)
+        if callable(getter):
+            try:
+                return int(getter())
+            except Exception:
+                pass
+    size = getattr(image, "size", None)
+    if isinstance(size, int) and not isinstance(size, bool):
+        return size
+
+    # E01 세그먼트 이미지는 모든 세그먼트 파일 크기의 합
+    segment = _E01_SEGMENT_RE.fullmatch(os.path.basename(image_path))
+    if segment:
+        directory = os.path.dirname(os.path.abspath(image_path))
+        pattern = re.compile(re.escape(segment.group(1)) + r"\.e" + segment.group(2) + r"(\d{2}|[a-z]{2})", re.IGNORECASE)
+        try:
+            return sum(
+                entry.stat().st_size for entry in os.scandir(directory)
+                if entry.is_file() and pattern.fullmatch(entry.name)
+            )
+        except OSError:
+            return None
+
+    # 블록 디바이스는 st_size 가 0 이므로 끝으로 seek 하여 크기 확인 (실패 시 None)
+    if stat.S_ISREG(st.st_mode):
+        return st.st_size
+    try:
+        with open(image_path, "rb") as f:
+            return f.seek(0, os.SEEK_END)
+    except OSError:
+        return None
+
+
+def _pick_tmp(image_size: int | None) -> str:
+    # 여유 공간이 이미지 크기의 2배 이상이면 RAM 기반 tmpfs 사용 (크기를 모르면 사용 안 함)
+    shm = "/dev/shm"
+    if image_size and os.path.isdir(shm):
+        try:
+            if shutil.disk_usage(shm).free > 2 * image_size:
+                return shm
+        except OSError:
+            pass
+    return tempfile.gettempdir()
+
+
+def _discard_output(source: Any) -> None:
+    # 병합이 끝난 중간 파서 출력은 즉시 삭제 (tmpfs 점유 최소화)
+    if isinstance(source, Path):
+        source.unlink(missing_ok=True)
+
+
+def _process_partition(
+    layout_key: tuple,
+    index: int,
+    output_path: str,
+    temp_root: str,
+    pretty: bool = False
+) -> dict[str, Any]:
+    try:
+        return _analyze_partition(layout_key, index, output_path, temp_root, pretty)
+    except OSError as e:
+        disk_root = tempfile.gettempdir()
+        if e.errno != errno.ENOSPC or temp_root == disk_root:
+            raise
+    # tmpfs 공간이 부족하면 디스크 임시 디렉토리에서 다시 처리
+    return _analyze_partition(layout_key, index, output_path, disk_root, pretty)
+
+
+def _analyze_partition(
+    layout_key: tuple,
+    index: int,
+    output_path: str,
+    temp_root: str,
+    pretty: bool = False
+) -> dict[str, Any]:
+    # 워커 프로세스에서는 이미지를 다시 열고 (pyewf 핸들은 pickle 불가),
+    # 같은 프로세스에서는 캐시된 핸들을 재사용
+
+    # 임시 디렉토리 사용
+    with tempfile.TemporaryDirectory(dir=temp_root) as temp_dir:
+        temp_path = Path(temp_dir)
+
+        with _cached_image(layout_key) as image:
+            part = find_ntfs_partitions(image)[index]
+            extracted = _extract_artifacts(NTFSExtractor(part), temp_path)
+
+        part_result = {
+            "partition": index,
+            "offset": part.offset,
+            "cluster_size": part.cluster_size,
+            "output_files": {}
+        }
 
-        with ImageHandler(input_path) as image:
-            partitions = find_ntfs_partitions(image)
+        partition_info = {
+            "partition_index": index,
+            "offset": part.offset,
+            "cluster_size": part.cluster_size
+        }
 
-            for i, part in enumerate(partitions):
-                part_result = {
-                    "partition": i,
-                    "offset": part.offset,
-                    "cluster_size": part.cluster_size,
-                    "output_files": {}
-                }
+        # 아티팩트별 파서 출력 경로 (실패 시 error dict, 미추출 시 None)
+        sources = {"MFT": None, "UsnJrnl": None, "LogFile": None}
+
+        # 세 파서는 서로 독립적이므로 스레드로 동시 실행
+        futures = {}
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            if "mft" in extracted:
+                futures["MFT"] = executor.submit(
+                    _run_parser, parse_mft_file, extracted["mft"], temp_path / "MFT.json",
+                    include_deleted=True, output_format="json", include_path=True
+                )
+            if "logfile" in extracted:
+                futures["LogFile"] = executor.submit(
+                    _run_parser, _parse_logfile, extracted["logfile"], temp_path / "LogFile.json",
+                    output_format="json"
+                )
+            if "usnjrnl" in extracted:
+                futures["UsnJrnl"] = executor.submit(
+                    _run_parser, _parse_usnjrnl, extracted["usnjrnl"], temp_path / "UsnJrnl.json",
+                    mft_path=None, output_format="json", include_path=False
+                )
+
+        for key, future in futures.items():
+            sources[key] = future.result()
+
+        # MFT JSON 파일 저장 (별도 파일)
+        mft_json_path = Path(output_path) / f"partition{index}_mft.json"
+        _write_combined(mft_json_path, partition_info, [("MFT", sources["MFT"])])
+        _discard_output(sources["MFT"])
+        if pretty:
+            _reindent_json(mft_json_path)
+        part_result["output_files"]["mft"] = str(mft_json_path)
+
+        # Journal (UsnJrnl + LogFile) JSON 파일 저장 (통합, 별도 파일)
+        journal_json_path = Path(output_path) / f"partition{index}_journal.json"
+        _write_combined(
+            journal_json_path,
+            partition_info,
+            [("UsnJrnl", sources["UsnJrnl"]), ("LogFile", sources["LogFile"])]
+        )
+        _discard_output(sources["UsnJrnl"])
+        _discard_output(sources["LogFile"])
+        if pretty:
+            _reindent_json(journal_json_path)
+        part_result["output_files"]["journal"] = str(journal_json_path)
 
-                extractor = NTFSExtractor(part)
+    return part_result
 
-                partition_info = {
-                    "partition_index": i,
-                    "offset": part.offset,
-                    "cluster_size": part.cluster_size
-                }
 
-                # MFT 데이터 (별도 파일)
-                mft_data = {
-                    "partition_info": partition_info,
-                    "MFT": []
-                }
+@mcp.tool()
+def extract_and_analyze(input_path: str, output_path: str, pretty: bool = False) -> dict[str, Any]:
 
-                # Journal 데이터 (UsnJrnl + LogFile 통합, 별도 파일)
-                journal_data = {
-                    "partition_info": partition_info,
-                    "UsnJrnl": [],
-                    "LogFile": []
-                }
+    st = _stat_file(input_path, allow_device=True)
+    if st is None:
+        return {"success": False, "output_path": output_path}
 
-                # 임시 디렉토리 사용
-                with tempfile.TemporaryDirectory() as temp_dir:
-                    temp_path = Path(temp_dir)
-
-                    # MFT 추출 및 파싱
-                    mft_raw = temp_path / "MFT"
-                    mft_json = temp_path / "MFT.json"
-                    if extractor.extract_mft(str(mft_raw)):
-                        try:
-                            parse_mft_file(str(mft_raw), str(mft_json), include_deleted=True, output_format="json", include_path=True)
-                            with open(mft_json, "r", encoding="utf-8") as f:
-                                mft_data["MFT"] = json.load(f)
-                        except Exception as e:
-                            mft_data["MFT"] = {"error": str(e)}
-
-                    # LogFile 추출 및 파싱
-                    logfile_raw = temp_path / "LogFile"
-                    logfile_json = temp_path / "LogFile.json"
-                    if extractor.extract_logfile(str(logfile_raw)):
-                        try:
-                            _parse_logfile(str(logfile_raw), str(logfile_json), output_format="json")
-                            with open(logfile_json, "r", encoding="utf-8") as f:
-                                journal_data["LogFile"] = json.load(f)
-                        except Exception as e:
-                            journal_data["LogFile"] = {"error": str(e)}
-
-                    # UsnJrnl 추출 및 파싱
-                    usnjrnl_raw = temp_path / "UsnJrnl_J"
-                    usnjrnl_json = temp_path / "UsnJrnl.json"
-                    if extractor.extract_usnjrnl(str(usnjrnl_raw), verbose=False):
-                        try:
-                            parse_usnjrnl(str(usnjrnl_raw), str(usnjrnl_json), mft_path=None, output_format="json", include_path=False)
-                            with open(usnjrnl_json, "r", encoding="utf-8") as f:
-                                journal_data["UsnJrnl"] = json.load(f)
-                        except Exception as e:
-                            journal_data["UsnJrnl"] = {"error": str(e)}
-
-                # MFT JSON 파일 저장
-                mft_json_path = Path(output_path) / f"partition{i}_mft.json"
-                with open(mft_json_path, "w", encoding="utf-8") as f:
-                    json.dump(mft_data, f, ensure_ascii=False, indent=2)
-                part_result["output_files"]["mft"] = str(mft_json_path)
-
-                # Journal (UsnJrnl + LogFile) JSON 파일 저장
-                journal_json_path = Path(output_path) / f"partition{i}_journal.json"
-                with open(journal_json_path, "w", encoding="utf-8") as f:
-                    json.dump(journal_data, f, ensure_ascii=False, indent=2)
-                part_result["output_files"]["journal"] = str(journal_json_path)
+    try:
+        start_time = perf_counter_ns()
+        Path(output_path).mkdir(parents=True, exist_ok=True)
 
-                results["partitions"].append(part_result)
+        results = {"partitions": []}
 
-        results["elapsed_seconds"] = (datetime.now() - start_time).total_seconds()
+        # 캐시된 파티션 레이아웃이 있으면 이미지 열기 생략
+        layout_key = _layout_key(input_path, st)
+        layout = _partition_layouts.get(layout_key)
+        if layout == ():
+            return {"success": True, "output_path": output_path}
+
+        with _cached_image(layout_key) as image:
+            if layout is None:
+                layout = _partition_layout(find_ntfs_partitions(image))
+                _partition_layouts[layout_key] = layout
+            image_size = _image_size(input_path, st, image)
+
+        if not layout:
+            return {"success": True, "output_path": output_path}
+
+        temp_root = _pick_tmp(image_size)
+        if len(layout) == 1:
+            # 단일 파티션은 프로세스 생성 없이 현재 프로세스에서 처리
+            part_results = [_process_partition(layout_key, 0, output_path, temp_root, pretty)]
+        else:
+            # 파티션은 서로 독립적이므로 프로세스별로 추출 + 파싱
+            # (멀티스레드 서버 프로세스를 fork 하지 않도록 spawn 사용)
+            workers = min(len(layout), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+                futures = [
+                    executor.submit(_process_partition, layout_key, i, output_path, temp_root, pretty)
+                    for i in range(len(layout))
+                ]
+                part_results = [future.result() for future in as_completed(futures)]
+
+        results["partitions"] = sorted(part_results, key=lambda r: r["partition"])
+
+        results["elapsed_seconds"] = (perf_counter_ns() - start_time) / 1e9
         results["total_partitions"] = len(results["partitions"])
         results["input_path"] = input_path
         results["output_path"] = output_path
@@ -286,57 +628,247 @@ def extract_and_analyze(input_path: str, output_path: str) -> dict[str, Any]:
         return {"success": False, "output_path": output_path}
 
 
+# 검색 대상 아티팩트 키 (dict 루트 JSON)
+SEARCH_KEYS = ("UsnJrnl", "LogFile", "MFT")
+
+# extract_and_analyze 출력 파일별로 존재하는 아티팩트 키
+SEARCH_KEYS_BY_ARTIFACT = {
+    "mft": ("MFT",),
+    "journal": ("UsnJrnl", "LogFile"),
+}
+_ARTIFACT_FILE_RE = re.compile(r"partition\d+_(mft|journal)\.json")
+
+# output_path 지정 시 응답에 포함할 최대 매칭 레코드 수
+SEARCH_PREVIEW_LIMIT = 100
+
+
+def _compile_keyword(keyword: str):
+    # 대소문자가 없는 키워드(한글, 숫자, 기호 등)는 lower() 복사 없이 바로 검색
+    # (U+0307 은 'İ'.lower() 결과에 포함되므로 제외)
+    if keyword == keyword.lower() == keyword.upper() and "\u0307" not in keyword:
+        def search(text: str) -> bool:
+            return keyword in text
+
+        return search
+
+    # 문자열 값을 이어 붙인 텍스트에 lower() 를 한 번만 적용하고 C 수준 부분 문자열 검색
+    lowered = keyword.lower()
+
+    def search(text: str) -> bool:
+        return lowered in text.lower()
+
+    return search
+
+
+# lower() 결과에 ASCII 문자가 포함되는 비 ASCII 문자
+_CASE_FOLD_EXTRA = {"i": "\u0130", "k": "\u212a"}
+
+# 원시 바이트 사전 검사 시 한 번에 소문자 변환할 크기 (16 MiB)
+PREFILTER_CHUNK_SIZE = 16 << 20
+
+
+def _compile_prefilter(keyword: str):
+    # 디코딩 전 원시 바이트용 대소문자 무시 존재 검사 (판별할 수 없는 키워드는 None)
+    if not keyword or not keyword.isascii() or not keyword.isprintable() or '"' in keyword or "\\" in keyword:
+        return None
+
+    needle = keyword.lower().encode("ascii")
+
+    # 대소문자가 없는 구간(숫자, 기호)은 원문 그대로 존재해야 하므로 복사 없는 find 앵커로 사용
+    anchor = max(re.findall(rb"[^A-Za-z]+", keyword.encode("ascii")), key=len, default=b"")
+
+    # UTF-8 원문 또는 JSON \uXXXX 이스케이프 형태의 비 ASCII 문자를 대응 ASCII 문자로 치환
+    # (파일 내 검색 형태들, 백슬래시 뒤의 검색 형태들, 소문자 변환된 청크에서의 형태, 대응 ASCII 문자)
+    folds = []
+    for letter, extras in _CASE_FOLD_EXTRA.items():
+        if letter not in keyword.lower():
+            continue
+        for extra in extras:
+            utf8 = extra.encode("utf-8")
+            escaped = (b"\\u%04x" % ord(extra), b"\\u%04X" % ord(extra))
+            folds.append(((utf8,), (), utf8, letter.encode("ascii")))
+            folds.append((escaped, tuple(b"\\" + raw for raw in escaped), escaped[0], letter.encode("ascii")))
+
+    # 청크 경계에 걸친 매칭을 위한 겹침 (문자당 최대 6바이트 이스케이프)
+    overlap = 6 * len(needle)
+
+    def search(mm) -> bool:
+        if anchor and mm.find(anchor) == -1:
+            return False
+
+        # 파일에 실제로 존재하는 비 ASCII 문자만 치환 대상으로 사용
+        active_folds = []
+        for raw_forms, escaped_forms, folded, letter in folds:
+            if not any(mm.find(raw) != -1 for raw in raw_forms):
+                continue
+            # 이스케이프가 백슬래시 뒤에 오면 (원시 \\u0130 은 İ 가 아닌 문자열 \u0130) 단순 치환이
+            # 매칭을 지울 수 있으므로 사전 검사를 포기하고 디코딩 후 검색으로 판정
+            if any(mm.find(raw) != -1 for raw in escaped_forms):
+                return True
+            active_folds.append((folded, letter))
+
+        for start in range(0, len(mm), PREFILTER_CHUNK_SIZE):
+            chunk = mm[start:start + PREFILTER_CHUNK_SIZE + overlap].lower()
+            for folded, letter in active_folds:
+                chunk = chunk.replace(folded, letter)
+            if needle in chunk:
+                return True
+        return False
+
+    return search
+
+
+def _file_contains(json_path: str, size: int, search) -> bool:
+    # mmap 으로 파일 전체를 복사 없이 스캔
+    if size == 0:
+        return True
+    with open(json_path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return search(mm)
+
+
+def _contains_keyword(obj: Any, search) -> bool:
+    if isinstance(obj, str):
+        return search(obj)
+    if not isinstance(obj, (dict, list)):
+        return False
+
+    # 컨테이너의 문자열 값은 NUL 로 이어 붙여 한 번의 검색으로 검사하고,
+    # 하위 컨테이너만 스택에 쌓음 (숫자/None 은 건너뜀)
+    stack = deque((obj,))
+    pop = stack.pop
+    push = stack.append
+    join = "\x00".join
+    while stack:
+        cur = pop()
+        values = cur.values() if isinstance(cur, dict) else cur
+        texts = []
+        for value in values:
+            if isinstance(value, str):
+                texts.append(value)
+            elif isinstance(value, (dict, list)):
+                push(value)
+        if texts and search(join(texts)):
+            return True
+    return False
+
+
+def _is_list_rooted(json_path: str) -> bool:
+    # 첫 번째 공백이 아닌 바이트로 루트 타입 판별
+    with open(json_path, "rb") as f:
+        while chunk := f.read(4096):
+            stripped = chunk.lstrip()
+            if stripped:
+                return stripped[:1] == b"["
+    return False
+
+
+# UTF-16 서로게이트 JSON 이스케이프 (\ud800 - \udfff)
+_SURROGATE_ESCAPE_RE = re.compile(rb"\\u[dD][89a-fA-F][0-9a-fA-F]{2}")
+
+
+def _has_lone_surrogate(json_path: str) -> bool:
+    # 짝이 없는 서로게이트 이스케이프 존재 여부 (NTFS 파일명에는 허용됨)
+    with open(json_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return False
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pos = 0
+            while matched := _SURROGATE_ESCAPE_RE.search(mm, pos):
+                if int(matched[0][2:], 16) >= 0xDC00:
+                    return True
+                low = _SURROGATE_ESCAPE_RE.match(mm, matched.end())
+                if low is None or int(low[0][2:], 16) < 0xDC00:
+                    return True
+                pos = low.end()
+    return False
+
+
+def _iter_records(json_path: str):
+    # yajl2_c 백엔드는 짝 없는 서로게이트를 '?' 로 바꾸거나 디코딩에 실패하므로
+    # 해당 파일은 원문 그대로 디코딩하는 순수 Python 백엔드로 처리 (느리지만 정확)
+    backend = ijson.get_backend("python") if _has_lone_surrogate(json_path) else ijson
+
+    if _is_list_rooted(json_path):
+        with open(json_path, "rb") as f:
+            yield from backend.items(f, "item", use_float=True)
+        return
+
+    # extract_and_analyze 출력 파일은 파일명으로 키를 결정 (불필요한 키 스캔 생략)
+    matched = _ARTIFACT_FILE_RE.fullmatch(os.path.basename(json_path))
+    keys = SEARCH_KEYS_BY_ARTIFACT[matched.group(1)] if matched else SEARCH_KEYS
+
+    # 아티팩트 키마다 새 파일 핸들로 스트리밍
+    for key in keys:
+        with open(json_path, "rb") as f:
+            yield from backend.items(f, f"{key}.item", use_float=True)
+
+
 @mcp.tool()
 def search_keyword(
     json_path: str,
-    keyword: str
+    keyword: str,
+    output_path: str | None = None
 ) -> dict[str, Any]:
 
-    import json
-
-    if not Path(json_path).exists():
+    st = _stat_file(json_path)
+    if st is None:
         return {"success": False, "error": f"JSON file not found: {json_path}"}
 
-    def contains_keyword(obj: Any, keyword: str) -> bool:
-        if isinstance(obj, str):
-            return keyword.lower() in obj.lower()
-        elif isinstance(obj, dict):
-            return any(contains_keyword(v, keyword) for v in obj.values())
-        elif isinstance(obj, list):
-            return any(contains_keyword(item, keyword) for item in obj)
-        return False
+    # 결과 파일이 입력 파일과 같으면 읽기 전에 입력이 잘려 나가므로 거부
+    if output_path:
+        try:
+            same_file = os.path.samestat(os.stat(output_path), st)
+        except (OSError, ValueError):
+            same_file = False
+        if same_file:
+            return {"success": False, "error": f"output_path must differ from json_path: {output_path}"}
 
     try:
-        start_time = datetime.now()
-
-        with open(json_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        start_time = perf_counter_ns()
 
+        search = _compile_keyword(keyword)
         matches = []
-
-        if isinstance(data, list):
-            for record in data:
-                if contains_keyword(record, keyword):
-                    matches.append(record)
-        elif isinstance(data, dict):
-            for key in ["UsnJrnl", "LogFile", "MFT"]:
-                if key in data and isinstance(data[key], list):
-                    for record in data[key]:
-                        if contains_keyword(record, keyword):
-                            matches.append(record)
-
-        elapsed = (datetime.now() - start_time).total_seconds()
-
-        return {
+        append = matches.append
+        total = 0
+
+        # 파일 바이트에 키워드가 없으면 JSON 디코딩 자체를 생략
+        prefilter = _compile_prefilter(keyword)
+        records = _iter_records(json_path)
+        if prefilter is not None and not _file_contains(json_path, st.st_size, prefilter):
+            records = ()
+
+        # output_path 지정 시 매칭 결과를 NDJSON 으로 기록하고 미리보기만 반환
+        with (open(output_path, "wb", buffering=WRITE_BUFFER_SIZE) if output_path else nullcontext()) as out:
+            # 레코드 단위로 스트리밍하며 매칭되지 않은 레코드는 즉시 폐기
+            for record in records:
+                if _contains_keyword(record, search):
+                    total += 1
+                    if out is None:
+                        append(record)
+                        continue
+                    out.write(_dumps(record))
+                    out.write(b"\n")
+                    if total <= SEARCH_PREVIEW_LIMIT:
+                        append(record)
+
+        elapsed = (perf_counter_ns() - start_time) / 1e9
+
+        result = {
             "success": True,
             "keyword": keyword,
             "json_path": json_path,
-            "total_matches": len(matches),
-            "elapsed_seconds": elapsed,
-            "matches": matches
+            "total_matches": total,
+            "elapsed_seconds": elapsed
         }
-
-    except json.JSONDecodeError as e:
+        if output_path:
+            result["matches_file"] = output_path
+            result["preview"] = matches
+        else:
+            result["matches"] = matches
+        return result
+
+    except ijson.JSONError as e:
         return {"success": False, "error": f"Invalid JSON file: {e}"}
     except Exception as e:
         return {"success": False, "error": str(e)}